@@ -83,11 +83,14 @@ def get_extension():
     search_tool = schema_tool(bioimage_archive_client.search_bioimage_archive)
     read_tool = schema_tool(bioimage_archive_client.read_bioimage_archive_study)
 
+    # the schemas are fixed, build them once rather than on every request
+    schemas = {
+        "search": search_tool.input_model.schema(),
+        "read": read_tool.input_model.schema(),
+    }
+
     async def get_schema():
-        return {
-            "search": search_tool.input_model.schema(),
-            "read": read_tool.input_model.schema(),
-        }
+        return schemas
 
     return ChatbotExtension(
         id="bioimage_archive",
@@ -1,6 +1,9 @@
 import os
 import asyncio
+import threading
+from collections import OrderedDict
 from functools import partial
+import numpy as np
 from pydantic import BaseModel, Field
 from typing import Any, Dict, Optional
 from bioimageio_chatbot.knowledge_base import load_knowledge_base
@@ -15,43 +18,107 @@ class DocWithScore(BaseModel):
     score: float = Field(description="The relevance score of the retrieved document.")
 
 
+# Maximum cosine distance for two queries to share cached results. The knowledge base
+# is embedded with text-embedding-ada-002 (the OpenAIEmbeddings default), which puts
+# related but different questions above 0.95 cosine similarity, so only near-identical
+# queries should hit.
+SIMILARITY_CACHE_THRESHOLD = float(
+    os.environ.get("BIOIMAGEIO_DOCS_CACHE_THRESHOLD", "0.005")
+)
+
+
+class SimilarityCache:
+    """An LRU cache of retrieval results keyed by the query embedding.
+
+    A lookup hits when the cosine distance between the query and the nearest
+    cached query is within `threshold`, so repeated or near-duplicate
+    questions skip the vector database entirely.
+    """
+
+    def __init__(self, capacity: int = 512, threshold: float = SIMILARITY_CACHE_THRESHOLD):
+        self.capacity = capacity
+        self.threshold = threshold
+        # L2-normalized query embeddings, one row per slot
+        self._keys = None
+        # slot -> (top_k, results), ordered from least to most recently used
+        self._entries = OrderedDict()
+
+    @staticmethod
+    def normalize(embedding):
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.sqrt(vector.dot(vector))
+        return vector / norm if norm else vector
+
+    def _nearest(self, embedding):
+        distances = 1.0 - self._keys[: len(self._entries)] @ embedding
+        slot = int(np.argmin(distances))
+        return slot, distances[slot]
+
+    def get(self, embedding, top_k):
+        if not self._entries:
+            return None
+        slot, distance = self._nearest(embedding)
+        if distance > self.threshold:
+            return None
+        cached_top_k, results = self._entries[slot]
+        if cached_top_k < top_k:
+            return None
+        self._entries.move_to_end(slot)
+        return results[:top_k]
+
+    def put(self, embedding, top_k, results):
+        if self._keys is None:
+            self._keys = np.zeros((self.capacity, len(embedding)), dtype=np.float32)
+        slot = None
+        if self._entries:
+            nearest, distance = self._nearest(embedding)
+            if distance <= self.threshold:
+                # a near-duplicate query cached with a smaller top_k, replace it
+                slot = nearest
+        if slot is None:
+            if len(self._entries) < self.capacity:
+                slot = len(self._entries)
+            else:
+                slot, _ = self._entries.popitem(last=False)
+        self._keys[slot] = embedding
+        self._entries[slot] = (top_k, results)
+        self._entries.move_to_end(slot)
+
+
 async def run_extension(
     docs_store_dict,
+    similarity_cache,
     channel_id,
-    query: str = Field(
-        description="The query used to retrieve documents related to the user's request. It should be a sentence which will be used to match descriptions using the OpenAI text embedding to match document chunks in a vector database."
-    ),
-    top_k: int = Field(
-        3,
-        description="The maximum number of search results to return. Should use a small number to avoid overwhelming the user.",
-    ),
+    query: str,
+    top_k: int = 3,
 ):
-    channel_results = []
-    # channel_urls = []
     # limit top_k from 1 to 15
     top_k = max(1, min(top_k, 15))
     docs_store = docs_store_dict[channel_id]
 
-    print(f"Retrieving documents from database {channel_id} with query: {query}")
-    channel_results.append(
-        await docs_store.asimilarity_search_with_relevance_scores(
-            query, k=top_k
-        )
+    query_embedding = SimilarityCache.normalize(
+        await docs_store.embedding_function.aembed_query(query)
     )
+    docs_with_score = similarity_cache.get(query_embedding, top_k)
+    if docs_with_score is not None:
+        print(f"Using cached documents from database {channel_id} for query: {query}")
+        return docs_with_score
 
+    print(f"Retrieving documents from database {channel_id} with query: {query}")
+    # search with the embedding computed above to avoid embedding the query again,
+    # the results are already sorted by relevance score
+    relevance_score_fn = docs_store._select_relevance_score_fn()
     docs_with_score = [
         DocWithScore(
             doc=doc.page_content,
-            score=round(score, 2),
+            score=round(relevance_score_fn(score), 2),
             metadata=doc.metadata,  # , base_url=base_url
         )
-        for results_with_scores in channel_results
-        for doc, score in results_with_scores
-    ]
-    # sort by relevance score
-    docs_with_score = sorted(docs_with_score, key=lambda x: x.score, reverse=True)[
-        : top_k
+        for doc, score in await docs_store.asimilarity_search_with_score_by_vector(
+            query_embedding, k=top_k
+        )
     ]
+    similarity_cache.put(query_embedding, top_k, docs_with_score)
 
     if len(docs_with_score) > 2:
         print(
@@ -65,8 +132,40 @@ async def run_extension(
 def title_case(s):
     return s.replace(".", " ").replace("-", " ").title().replace(" ", "")
 
-def create_tool(docs_store_dict, collection):
-    async def run_extension(
+class DocsStoreLoader:
+    """Load the knowledge base on the first call and return it on later calls.
+
+    A failed load is logged and raised, and the next call tries again.
+    """
+
+    def __init__(self, load):
+        self._load = load
+        self._lock = threading.Lock()
+        self.docs_store_dict = None
+
+    def __call__(self):
+        if self.docs_store_dict is not None:
+            return self.docs_store_dict
+        with self._lock:
+            if self.docs_store_dict is None:
+                try:
+                    self.docs_store_dict = self._load()
+                except Exception as e:
+                    print(f"Failed to load the knowledge base. Error: {e}")
+                    raise
+            return self.docs_store_dict
+
+    def warm_up(self):
+        try:
+            self()
+        except Exception:
+            # already logged, the next search retries the load
+            pass
+
+def create_tool(docs_store_loader, collection):
+    similarity_cache = SimilarityCache()
+
+    async def search_docs(
         query: str = Field(
             description="The query used to retrieve documents related to the user's request. It should be a sentence which will be used to match descriptions using the OpenAI text embedding to match document chunks in a vector database."
         ),
@@ -75,41 +174,14 @@ def create_tool(docs_store_dict, collection):
             description="The maximum number of search results to return. Should use a small number to avoid overwhelming the user.",
         ),
     ):
-        channel_results = []
-        # channel_urls = []
-        # limit top_k from 1 to 15
-        top_k = max(1, min(top_k, 15))
-        docs_store = docs_store_dict[collection["id"]]
-
-        print(f"Retrieving documents from database {collection['id']} with query: {query}")
-        channel_results.append(
-            await docs_store.asimilarity_search_with_relevance_scores(
-                query, k=top_k
-            )
+        docs_store_dict = docs_store_loader.docs_store_dict
+        if docs_store_dict is None:
+            # wait for the knowledge base without blocking the event loop
+            docs_store_dict = await asyncio.to_thread(docs_store_loader)
+        return await run_extension(
+            docs_store_dict, similarity_cache, collection["id"], query, top_k
         )
 
-        docs_with_score = [
-            DocWithScore(
-                doc=doc.page_content,
-                score=round(score, 2),
-                metadata=doc.metadata,  # , base_url=base_url
-            )
-            for results_with_scores in channel_results
-            for doc, score in results_with_scores
-        ]
-        # sort by relevance score
-        docs_with_score = sorted(docs_with_score, key=lambda x: x.score, reverse=True)[
-            : top_k
-        ]
-
-        if len(docs_with_score) > 2:
-            print(
-                f"Retrieved documents:\n{docs_with_score[0].doc[:20] + '...'} (score: {docs_with_score[0].score})\n{docs_with_score[1].doc[:20] + '...'} (score: {docs_with_score[1].score})\n{docs_with_score[2].doc[:20] + '...'} (score: {docs_with_score[2].score})"
-            )
-        else:
-            print(f"Retrieved documents:\n{docs_with_score}")
-        return docs_with_score
-
     channel_id = collection["id"]
     base_url = collection.get("base_url")
     if base_url:
@@ -117,36 +189,35 @@ def create_tool(docs_store_dict, collection):
     else:
         base_url_prompt = ""
         
-    run_extension.__name__ = "Search" + title_case(channel_id)
-    run_extension.__doc__ = f"""Searching documentation for {channel_id}: {collection['description']}.{base_url_prompt}"""
-    return schema_tool(run_extension)
+    search_docs.__name__ = "Search" + title_case(channel_id)
+    search_docs.__doc__ = f"""Searching documentation for {channel_id}: {collection['description']}.{base_url_prompt}"""
+    return schema_tool(search_docs)
 
 def get_extension():
     collections = get_manifest()["collections"]
     knowledge_base_path = os.environ.get(
         "BIOIMAGEIO_KNOWLEDGE_BASE_PATH", "./bioimageio-knowledge-base"
     )
-    assert (
-        knowledge_base_path is not None
-    ), "Please set the BIOIMAGEIO_KNOWLEDGE_BASE_PATH environment variable to the path of the knowledge base."
     if not os.path.exists(knowledge_base_path):
         print(
             f"The knowledge base is not found at {knowledge_base_path}, will download it automatically."
         )
         os.makedirs(knowledge_base_path, exist_ok=True)
 
-    knowledge_base_path = os.environ.get(
-        "BIOIMAGEIO_KNOWLEDGE_BASE_PATH", "./bioimageio-knowledge-base"
+    # load the knowledge base in the background instead of blocking startup,
+    # the first search waits for it if it is not ready yet
+    docs_store_loader = DocsStoreLoader(
+        partial(load_knowledge_base, knowledge_base_path, collections)
     )
-    docs_store_dict = load_knowledge_base(knowledge_base_path)
-    
+    threading.Thread(target=docs_store_loader.warm_up, daemon=True).start()
+
     docs_tools = {}
     books_tools = {}
     for col in collections:
         if "book" in col["id"]:
-            books_tools["search_" + col["id"]] = create_tool(docs_store_dict, col)
+            books_tools["search_" + col["id"]] = create_tool(docs_store_loader, col)
         else:
-            docs_tools["search_" + col["id"]] = create_tool(docs_store_dict, col)
+            docs_tools["search_" + col["id"]] = create_tool(docs_store_loader, col)
 
     if docs_tools:
         sinfo1 = ChatbotExtension(
@@ -1,7 +1,9 @@
 from bioimageio_chatbot.utils import ChatbotExtension
 from openai import AsyncOpenAI
 from schema_agents import schema_tool
+import asyncio
 import base64
+import weakref
 from pydantic import Field, BaseModel
 from typing import Optional, List
 import httpx
@@ -16,27 +18,44 @@ def encode_image(image_path):
   with open(image_path, "rb") as image_file:
     return base64.b64encode(image_file.read()).decode('utf-8')
 
+# AsyncOpenAI clients keep a connection pool bound to the event loop they run on
+_openai_clients = weakref.WeakKeyDictionary()
+
+def get_openai_client():
+    loop = asyncio.get_running_loop()
+    if loop not in _openai_clients:
+        _openai_clients[loop] = AsyncOpenAI()
+    return _openai_clients[loop]
+
+async def download_image(client, image):
+    response = await client.get(image.url)
+    response.raise_for_status()
+    try:
+        return Image.open(BytesIO(response.content))
+    except Exception as e:
+        raise ValueError(f"Failed to read image {image.title or ''} from {image.url}. Error: {e}")
+
 async def aask(images, messages, max_tokens=1024):
-    aclient = AsyncOpenAI()
+    aclient = get_openai_client()
     user_message = []
-    # download the images and save it into a list of PIL image objects
-    img_objs = []
-    for image in images:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(image.url)
-            response.raise_for_status()
+    # download the images concurrently and save them into a list of PIL image objects
+    async with httpx.AsyncClient() as client:
+        tasks = [asyncio.ensure_future(download_image(client, image)) for image in images]
         try:
-            img = Image.open(BytesIO(response.content))
-        except Exception as e:
-            raise ValueError(f"Failed to read image {image.title or ''} from {image.url}. Error: {e}")
-        img_objs.append(img)
+            img_objs = await asyncio.gather(*tasks)
+        except Exception:
+            # cancel the remaining downloads and wait for them before the client is closed
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
     
     if len(img_objs) == 1:
         # plot the image with matplotlib
-        plt.imshow(img_objs[0])
+        fig, ax = plt.subplots()
+        ax.imshow(img_objs[0])
         if images[0].title:
-            plt.title(images[0].title)
-        fig = plt.gcf()
+            ax.set_title(images[0].title)
     else:
         # plot them in subplots with matplotlib in a row
         fig, ax = plt.subplots(1, len(img_objs), figsize=(15, 5))
@@ -55,8 +74,10 @@ async def aask(images, messages, max_tokens=1024):
     
     # save fig
     fig.savefig(buffer, format="png")
-    buffer.seek(0)
-    base64_image = base64.b64encode(buffer.read()).decode("utf-8")
+    # release the figure, pyplot keeps a reference to every open figure
+    plt.close(fig)
+    # encode straight from the buffer's memory instead of reading a copy out of it
+    base64_image = base64.b64encode(buffer.getbuffer()).decode("utf-8")
     # append the image to the user message
     user_message.append({
         "type": "image_url",
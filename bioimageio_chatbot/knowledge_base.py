@@ -1,9 +1,12 @@
 import os
+import math
 import requests
 import zipfile
 import shutil
 from langchain.text_splitter import CharacterTextSplitter, RecursiveCharacterTextSplitter
 from langchain_community.vectorstores import FAISS
+from langchain_community.vectorstores.faiss import dependable_faiss_import
+from langchain_community.vectorstores.utils import DistanceStrategy
 from langchain_community.document_loaders import TextLoader, PyPDFLoader
 from langchain_openai import OpenAIEmbeddings
 from langchain.docstore.document import Document
@@ -28,11 +31,36 @@ def load_docs_store(db_path, collection_name):
     # Load from vector store
     embeddings = OpenAIEmbeddings()
     docs_store = FAISS.load_local(index_name=collection_name, folder_path=db_path, embeddings=embeddings, allow_dangerous_deserialization=True)
+    return use_inner_product_index(docs_store)
+
+
+def inner_product_relevance_score_fn(similarity):
+    # Same scale as the euclidean relevance score, since the squared L2 distance
+    # between normalized vectors is 2 - 2 * similarity
+    return 1.0 - (2.0 - 2.0 * similarity) / math.sqrt(2)
+
+
+def use_inner_product_index(docs_store):
+    """Replace a flat L2 index with an inner product index over normalized vectors."""
+    faiss = dependable_faiss_import()
+    index = docs_store.index
+    if not isinstance(index, faiss.IndexFlatL2):
+        return docs_store
+    vectors = index.reconstruct_n(0, index.ntotal)
+    faiss.normalize_L2(vectors)
+    inner_product_index = faiss.IndexFlatIP(index.d)
+    inner_product_index.add(vectors)
+    docs_store.index = inner_product_index
+    docs_store.distance_strategy = DistanceStrategy.MAX_INNER_PRODUCT
+    # normalize the query vector on every search path, not only in the docs extension
+    docs_store._normalize_L2 = True
+    docs_store.override_relevance_score_fn = inner_product_relevance_score_fn
     return docs_store
 
 
-def load_knowledge_base(db_path):
-    collections = get_manifest()['collections']
+def load_knowledge_base(db_path, collections=None):
+    if collections is None:
+        collections = get_manifest()['collections']
     docs_store_dict = {}
     
     for collection in collections:
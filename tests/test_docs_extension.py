@@ -0,0 +1,81 @@
+import threading
+import time
+import numpy as np
+import pytest
+from bioimageio_chatbot.chatbot_extensions.docs_extension import DocsStoreLoader, SimilarityCache
+
+
+def embed(seed, dim=16):
+    return SimilarityCache.normalize(np.random.default_rng(seed).normal(size=dim))
+
+
+def test_similarity_cache_upgrades_top_k():
+    """Test that repeating a query with a larger top_k replaces its cache entry"""
+    cache = SimilarityCache(capacity=4)
+    query = embed(0)
+    cache.put(query, 3, ["a", "b", "c"])
+    assert cache.get(query, 3) == ["a", "b", "c"]
+    assert cache.get(query, 5) is None
+    cache.put(query, 5, ["a", "b", "c", "d", "e"])
+    assert len(cache._entries) == 1
+    assert cache.get(query, 5) == ["a", "b", "c", "d", "e"]
+    assert cache.get(query, 2) == ["a", "b"]
+
+
+def test_similarity_cache_evicts_least_recently_used():
+    """Test that a full cache reuses the slot of the least recently used query"""
+    cache = SimilarityCache(capacity=2)
+    first, second, third = embed(1), embed(2), embed(3)
+    cache.put(first, 3, ["first"])
+    cache.put(second, 3, ["second"])
+    # touch the first query so the second one becomes the least recently used
+    assert cache.get(first, 3) == ["first"]
+    cache.put(third, 3, ["third"])
+    assert len(cache._entries) == 2
+    assert cache.get(second, 3) is None
+    assert cache.get(first, 3) == ["first"]
+    assert cache.get(third, 3) == ["third"]
+
+
+def test_docs_store_loader_loads_once():
+    """Test that concurrent callers share a single knowledge base load"""
+    calls = []
+
+    def load():
+        calls.append(1)
+        time.sleep(0.2)
+        return {"docs": "store"}
+
+    loader = DocsStoreLoader(load)
+    threads = [threading.Thread(target=loader) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert loader.docs_store_dict == {"docs": "store"}
+    assert loader() == {"docs": "store"}
+    assert len(calls) == 1
+
+
+def test_docs_store_loader_retries_after_failure():
+    """Test that a failed load is raised and retried by the next call"""
+    calls = []
+
+    def load():
+        calls.append(1)
+        if len(calls) == 1:
+            raise Exception("No docs store is loaded")
+        return {"docs": "store"}
+
+    loader = DocsStoreLoader(load)
+    loader.warm_up()
+    assert loader.docs_store_dict is None
+    assert loader() == {"docs": "store"}
+    assert len(calls) == 2
+
+    failing_loader = DocsStoreLoader(lambda: 1 / 0)
+    with pytest.raises(ZeroDivisionError):
+        failing_loader()
+    with pytest.raises(ZeroDivisionError):
+        failing_loader()
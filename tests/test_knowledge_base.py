@@ -1,9 +1,44 @@
+import zlib
+import numpy as np
+import pytest
 from langchain_community.vectorstores import FAISS
+from langchain_core.embeddings import Embeddings
 from langchain_openai import OpenAIEmbeddings
+from bioimageio_chatbot.knowledge_base import use_inner_product_index
+
+class UnitEmbeddings(Embeddings):
+    """Deterministic unit-norm embeddings, like OpenAI's, for testing without the network"""
+
+    def __init__(self, scale=1.0):
+        self.scale = scale
+
+    def embed_documents(self, texts):
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text):
+        vector = np.random.default_rng(zlib.crc32(text.encode())).normal(size=16)
+        return list(self.scale * vector / np.linalg.norm(vector))
 
 def test_knowledge_base():
     """Test the knowledge base"""
     vectordb = FAISS.load_local(folder_path="./bioimageio-knowledge-base", index_name="bioimage.io", embeddings=OpenAIEmbeddings(), allow_dangerous_deserialization=True)
     retriever = vectordb.as_retriever(score_threshold=0.4)
     items = retriever.get_relevant_documents("community partner", verbose=True)
-    assert len(items) > 0
\ No newline at end of file
+    assert len(items) > 0
+
+def test_inner_product_index():
+    """Test that the inner product index ranks and scores like the euclidean index"""
+    texts = [f"document {i} about {topic}" for i, topic in enumerate(["cells", "nuclei", "models", "tracking", "segmentation"] * 4)]
+    queries = ["nuclei segmentation", "cell tracking", "download a model"]
+    vectordb = FAISS.from_texts(texts, UnitEmbeddings())
+    expected = {query: vectordb.similarity_search_with_relevance_scores(query, k=5) for query in queries}
+    use_inner_product_index(vectordb)
+    for query in queries:
+        results = vectordb.similarity_search_with_relevance_scores(query, k=5)
+        assert [doc.page_content for doc, _ in results] == [doc.page_content for doc, _ in expected[query]]
+        assert [score for _, score in results] == pytest.approx([score for _, score in expected[query]], abs=1e-5)
+    # queries which are not unit-norm are normalized before the search
+    vectordb.embedding_function = UnitEmbeddings(scale=3.0)
+    for query in queries:
+        results = vectordb.similarity_search_with_relevance_scores(query, k=5)
+        assert [score for _, score in results] == pytest.approx([score for _, score in expected[query]], abs=1e-5)